@@ -322,6 +322,11 @@ ADULT_CONTENT_DOMAINS = [
     "www.4tube.com",
 ]
 
+# Frozen-set views of the category lists for O(1) membership tests and
+# C-level set arithmetic against blocked-domain sets
+ADULT_CONTENT_DOMAINS_SET = frozenset(ADULT_CONTENT_DOMAINS)
+CASINO_GAMBLING_DOMAINS_SET = frozenset(CASINO_GAMBLING_DOMAINS)
+
 # Windows hosts file path
 HOSTS_FILE_PATH = r"C:\Windows\System32\drivers\etc\hosts"
 HOSTS_BACKUP_PATH = "backup_hosts"
@@ -4,10 +4,11 @@ Uses Flet's storage API (FLET_APP_STORAGE_DATA) for persistence.
 """
 import json
 import os
+import platform
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from .constants import DEFAULT_PASSWORD
+from .constants import DEFAULT_PASSWORD, SETTINGS_FILE
 
 
 class Settings:
@@ -17,7 +18,6 @@ class Settings:
         # CRITICAL: Use consistent settings path that works for both admin and normal user
         # When running as admin, FLET_APP_STORAGE_DATA might point to admin's AppData
         # We want to use the current user's AppData regardless of admin status
-        import platform
         if platform.system() == "Windows":
             # Always use current user's APPDATA\Roaming for consistent settings access
             # This ensures login works whether running as admin or normal user
@@ -33,7 +33,6 @@ class Settings:
                     self.settings_file = Path(app_data_path) / "settings.json"
                 else:
                     # Last resort: use local directory
-                    from .constants import SETTINGS_FILE
                     self.settings_file = Path(SETTINGS_FILE)
         else:
             # Non-Windows: use Flet's storage API or local file
@@ -41,7 +40,6 @@ class Settings:
             if app_data_path:
                 self.settings_file = Path(app_data_path) / "settings.json"
             else:
-                from .constants import SETTINGS_FILE
                 self.settings_file = Path(SETTINGS_FILE)
         
         # Ensure directory exists
@@ -50,7 +48,6 @@ class Settings:
         except (PermissionError, OSError):
             # Fallback to local directory silently
             try:
-                from .constants import SETTINGS_FILE
                 self.settings_file = Path(SETTINGS_FILE)
                 self.settings_file.parent.mkdir(parents=True, exist_ok=True)
             except Exception:
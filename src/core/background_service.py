@@ -2,11 +2,14 @@
 Background service manager - ensures app always runs and cannot be closed.
 """
 import sys
+import logging
 import subprocess
 import time
 import threading
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 class BackgroundService:
     """Manages app as always-running background service."""
@@ -24,7 +27,7 @@ class BackgroundService:
         self.running = True
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
-        print("Background service: Started monitoring")
+        logger.info("Started monitoring")
     
     def stop_monitoring(self) -> None:
         """Stop monitoring."""
@@ -38,7 +41,7 @@ class BackgroundService:
                 # In a real implementation, you'd check the process ID
                 time.sleep(5)
             except Exception as e:
-                print(f"Background service monitor error: {e}")
+                logger.error("Monitor error: %s", e)
     
     def prevent_close(self, page) -> None:
         """Prevent window from closing."""
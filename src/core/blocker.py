@@ -174,6 +174,33 @@ class Blocker:
             variations.append(f"www.{domain}")
         return variations
 
+    def block_custom_domains(self, domains: List[str]) -> Tuple[bool, Optional[str]]:
+        """Block several custom domains with a single hosts-file write."""
+        valid: List[str] = []
+        to_block: List[str] = []
+        for domain in domains:
+            domain = sanitize_domain(domain)
+            is_valid, _ = validate_domain(domain)
+            if is_valid:
+                valid.append(domain)
+                to_block.extend(self._get_domain_variations(domain))
+
+        if not to_block:
+            return False, "No valid domains"
+
+        try:
+            success = self.hosts_manager.block_domains(to_block, force=True)
+            if success:
+                for domain in valid:
+                    settings.add_custom_domain(domain)
+                return True, None
+            else:
+                return False, "Failed to block domains"
+        except PermissionError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"Error: {e}"
+
     def unblock_custom_domain(self, domain: str) -> Tuple[bool, Optional[str]]:
         """Unblock a custom domain."""
         domains_to_unblock = self._get_domain_variations(domain)
@@ -201,32 +228,36 @@ class Blocker:
         Sync settings with hosts file.
         Apply blocking for platforms that should be blocked,
         unblock platforms that should be unblocked.
+
+        The desired domain set is computed in memory first so the hosts
+        file is rewritten at most twice (one unblock, one block) instead
+        of once per platform/category.
         """
         if not self.is_admin():
             return
 
-        # Sync each platform
+        to_block: List[str] = []
+        to_unblock: List[str] = []
+
         for platform, domains in PLATFORM_DOMAINS.items():
-            should_be_blocked = settings.is_platform_blocked(platform)
-            
-            try:
-                if should_be_blocked:
-                    self.hosts_manager.block_domains(domains, force=True)
-                else:
-                    self.hosts_manager.unblock_domains(domains)
-            except Exception:
-                pass  # Continue with other platforms
+            if settings.is_platform_blocked(platform):
+                to_block.extend(domains)
+            else:
+                to_unblock.extend(domains)
 
-        # Sync adult content
         if settings.is_adult_content_blocked():
+            to_block.extend(ADULT_CONTENT_DOMAINS)
+
+        if settings.is_casino_gambling_blocked():
+            to_block.extend(CASINO_GAMBLING_DOMAINS)
+
+        if to_unblock:
             try:
-                self.hosts_manager.block_domains(ADULT_CONTENT_DOMAINS, force=True)
+                self.hosts_manager.unblock_domains(to_unblock)
             except Exception:
                 pass
-
-        # Sync casino/gambling
-        if settings.is_casino_gambling_blocked():
+        if to_block:
             try:
-                self.hosts_manager.block_domains(CASINO_GAMBLING_DOMAINS, force=True)
+                self.hosts_manager.block_domains(to_block, force=True)
             except Exception:
                 pass
@@ -3,15 +3,18 @@ DNS-level blocking proxy server - Advanced blocking mechanism.
 This provides much stronger blocking than hosts file alone.
 """
 import socket
+import logging
 import threading
 import subprocess
 import platform
 from typing import Set, Optional
 from pathlib import Path
 
-from ..config.constants import PLATFORM_DOMAINS, ADULT_CONTENT_DOMAINS
+from ..config.constants import PLATFORM_DOMAINS, ADULT_CONTENT_DOMAINS_SET
 from ..config.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class DNSBlocker:
     """DNS proxy server that blocks domains at DNS level."""
@@ -30,7 +33,7 @@ class DNSBlocker:
             return True
         
         if platform.system() != "Windows":
-            print("DNS blocker: Windows only feature")
+            logger.info("Windows only feature")
             return False
         
         try:
@@ -45,10 +48,10 @@ class DNSBlocker:
             # Set Windows DNS to use our local server
             self._set_dns_server()
             
-            print("DNS blocker: Started successfully")
+            logger.info("Started successfully")
             return True
         except Exception as e:
-            print(f"DNS blocker: Failed to start: {e}")
+            logger.error("Failed to start: %s", e)
             return False
     
     def stop(self) -> None:
@@ -61,7 +64,7 @@ class DNSBlocker:
                 pass
         # Restore original DNS
         self._restore_dns_server()
-        print("DNS blocker: Stopped")
+        logger.info("Stopped")
     
     def _update_blocked_domains(self) -> None:
         """Update list of blocked domains from settings."""
@@ -72,9 +75,10 @@ class DNSBlocker:
             if settings.is_platform_blocked(platform_name):
                 self.blocked_domains.update(domains)
         
-        # Add adult content domains
+        # Add adult content domains (frozenset view: deduplicated once at
+        # constants load, so update() is a straight set union)
         if settings.is_adult_content_blocked():
-            self.blocked_domains.update(ADULT_CONTENT_DOMAINS)
+            self.blocked_domains.update(ADULT_CONTENT_DOMAINS_SET)
         
         # Add custom domains
         custom_domains = settings.get_custom_domains()
@@ -86,15 +90,16 @@ class DNSBlocker:
         if not domain:
             return False
         
-        # Check exact match
-        if domain in self.blocked_domains:
-            return True
-        
-        # Check subdomain matches (e.g., www.facebook.com if facebook.com is blocked)
-        for blocked in self.blocked_domains:
-            if domain.endswith(f".{blocked}") or domain == blocked:
+        # Probe the domain and each parent suffix against the set, so
+        # www.facebook.com matches a blocked facebook.com. One O(1) lookup
+        # per label instead of scanning every blocked domain per query.
+        while domain:
+            if domain in self.blocked_domains:
                 return True
-        
+            _, sep, domain = domain.partition(".")
+            if not sep:
+                break
+
         return False
     
     def _dns_server_loop(self) -> None:
@@ -104,7 +109,7 @@ class DNSBlocker:
             self.socket.bind((self.dns_server, self.dns_port))
             self.socket.settimeout(1.0)
             
-            print(f"DNS blocker: Listening on {self.dns_server}:{self.dns_port}")
+            logger.info("Listening on %s:%s", self.dns_server, self.dns_port)
             
             while self.running:
                 try:
@@ -120,19 +125,19 @@ class DNSBlocker:
                             # Return NXDOMAIN (domain not found)
                             response = self._create_nxdomain_response(query_id, data)
                             self.socket.sendto(response, addr)
-                            print(f"DNS blocker: Blocked {domain}")
+                            logger.debug("Blocked %s", domain)
                         else:
                             # Forward to real DNS server
                             self._forward_dns_query(data, addr)
                     except Exception as e:
-                        print(f"DNS blocker: Error processing query: {e}")
+                        logger.debug("Error processing query: %s", e)
                 except socket.timeout:
                     continue
                 except Exception as e:
                     if self.running:
-                        print(f"DNS blocker: Error in server loop: {e}")
+                        logger.error("Error in server loop: %s", e)
         except Exception as e:
-            print(f"DNS blocker: Server error: {e}")
+            logger.error("Server error: %s", e)
         finally:
             if self.socket:
                 try:
@@ -192,7 +197,7 @@ class DNSBlocker:
             if self.socket:
                 self.socket.sendto(response, addr)
         except Exception as e:
-            print(f"DNS blocker: Forward error: {e}")
+            logger.debug("Forward error: %s", e)
     
     def _set_dns_server(self) -> None:
         """Set Windows DNS to use our local server."""
@@ -213,7 +218,7 @@ class DNSBlocker:
                 creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
         except Exception as e:
-            print(f"DNS blocker: Error setting DNS: {e}")
+            logger.error("Error setting DNS: %s", e)
     
     def _restore_dns_server(self) -> None:
         """Restore original DNS server settings."""
@@ -224,7 +229,7 @@ class DNSBlocker:
                 creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
         except Exception as e:
-            print(f"DNS blocker: Error restoring DNS: {e}")
+            logger.error("Error restoring DNS: %s", e)
 
 
 # Global DNS blocker instance
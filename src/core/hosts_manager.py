@@ -3,16 +3,22 @@ Hosts file manager for Windows - handles reading, writing, and backing up hosts
 Simplified and optimized for reliable blocking/unblocking.
 """
 import os
+import mmap
 import shutil
+import hashlib
 import platform
 import subprocess
 import stat
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Optional, Set
 from datetime import datetime
 
 from ..config.constants import HOSTS_FILE_PATH, HOSTS_BACKUP_PATH, REDIRECT_IP
 
+# The Windows DNS client parses at most ~9 hostnames per hosts-file line;
+# packing entries keeps the file (and every scan of it) proportionally smaller.
+MAX_DOMAINS_PER_LINE = 9
+
 
 class HostsManager:
     """Manages Windows hosts file operations."""
@@ -21,6 +27,12 @@ class HostsManager:
         self.hosts_path = Path(HOSTS_FILE_PATH)
         self.backup_dir = Path(HOSTS_BACKUP_PATH)
         self.redirect_ip = REDIRECT_IP
+        self._last_backup_hash: Optional[bytes] = None
+        # Admin level is fixed for the process lifetime, so cache first answer
+        self._is_admin_cached: Optional[bool] = None
+        # Whether the hosts file is known to contain the DeepFocus marker
+        # (None until a full rewrite has established it)
+        self._marker_present: Optional[bool] = None
         self._ensure_backup_dir()
 
     def _ensure_backup_dir(self) -> None:
@@ -46,26 +58,33 @@ class HostsManager:
             pass
 
     def is_admin(self) -> bool:
-        """Check if running with administrator privileges."""
-        if platform.system() != "Windows":
-            return False
-        try:
-            import ctypes
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except Exception:
-            return False
+        """Check if running with administrator privileges (cached)."""
+        if self._is_admin_cached is None:
+            if platform.system() != "Windows":
+                self._is_admin_cached = False
+            else:
+                try:
+                    import ctypes
+                    self._is_admin_cached = ctypes.windll.shell32.IsUserAnAdmin() != 0
+                except Exception:
+                    self._is_admin_cached = False
+        return self._is_admin_cached
 
     def backup_hosts(self) -> bool:
-        """Create a backup of the hosts file."""
+        """Create a backup of the hosts file (skipped if unchanged since last backup)."""
         if not self.hosts_path.exists():
             return False
         try:
-            self.backup_dir.mkdir(parents=True, exist_ok=True)
-            # Keep only last 3 backups
+            content = self.hosts_path.read_bytes()
+            content_hash = hashlib.blake2b(content, digest_size=16).digest()
+            if content_hash == self._last_backup_hash:
+                return True  # Identical to the last backup - nothing to do
+            # Keep only last 3 backups (cleanup only when actually writing one)
             self._cleanup_old_backups(max_backups=3)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = self.backup_dir / f"hosts_backup_{timestamp}.txt"
-            shutil.copy2(self.hosts_path, backup_file)
+            backup_file.write_bytes(content)
+            self._last_backup_hash = content_hash
             return True
         except (IOError, PermissionError, OSError):
             return True  # Continue even if backup fails
@@ -75,14 +94,16 @@ class HostsManager:
         try:
             if not self.backup_dir.exists():
                 return
-            backup_files = sorted(
-                self.backup_dir.glob("hosts_backup_*.txt"),
-                key=lambda f: f.stat().st_mtime,
-                reverse=True
-            )
-            for old_backup in backup_files[max_backups:]:
+            # os.scandir caches stat info on the DirEntry, so the sort key
+            # doesn't cost one syscall per comparison like Path.stat() would
+            entries = [
+                e for e in os.scandir(self.backup_dir)
+                if e.name.startswith("hosts_backup_") and e.name.endswith(".txt")
+            ]
+            entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+            for old_backup in entries[max_backups:]:
                 try:
-                    old_backup.unlink()
+                    os.unlink(old_backup.path)
                 except Exception:
                     pass
         except Exception:
@@ -98,23 +119,62 @@ class HostsManager:
         except (IOError, PermissionError):
             return []
 
+    def _iter_block_entries(self) -> Iterator[bytes]:
+        """Yield lowercased domain tokens from redirect-IP lines as bytes.
+
+        Scans the hosts file via mmap instead of decoding every line into
+        str objects, so unified-hosts-style files with 100k+ entries don't
+        allocate a list of strings just to find our entries. Only matched
+        domain tokens are materialized. Redirect lines may be indented -
+        anything but whitespace before the IP disqualifies the match.
+        """
+        if not self.hosts_path.exists():
+            return
+        try:
+            f = open(self.hosts_path, "rb")
+        except (IOError, PermissionError):
+            return
+        with f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                data = f.read()  # Empty or unmappable file
+            try:
+                ip = self.redirect_ip.encode("ascii")
+                pos = data.find(ip)
+                while pos != -1:
+                    # Only whitespace may precede the IP on its line;
+                    # a '#' prefix (commented-out entry) must not match
+                    line_start = data.rfind(b"\n", 0, pos) + 1
+                    prefix = bytes(data[line_start:pos])
+                    if prefix and not prefix.isspace():
+                        pos = data.find(ip, pos + 1)
+                        continue
+                    end = data.find(b"\n", pos)
+                    if end == -1:
+                        end = len(data)
+                    parts = bytes(data[pos:end]).split()
+                    if len(parts) >= 2 and parts[0] == ip:
+                        for part in parts[1:]:
+                            if not part.startswith(b"#"):
+                                yield part.lower()
+                    pos = data.find(ip, end)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
     def get_blocked_domains(self) -> Set[str]:
         """Get set of currently blocked domains from hosts file."""
+        blocked: Set[str] = set()
         try:
-            lines = self.read_hosts()
-            blocked = set()
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-                if len(parts) >= 2 and parts[0] == self.redirect_ip:
-                    for part in parts[1:]:
-                        if not part.startswith("#"):
-                            blocked.add(part.lower())
-            return blocked
+            for entry in self._iter_block_entries():
+                try:
+                    blocked.add(entry.decode("utf-8"))
+                except UnicodeDecodeError:
+                    continue  # One bad token must not discard the rest
         except Exception:
-            return set()
+            pass  # Keep whatever was parsed before the failure
+        return blocked
 
     def _make_writable(self) -> bool:
         """Make hosts file writable, return True if was read-only."""
@@ -134,14 +194,23 @@ class HostsManager:
             except Exception:
                 pass
 
-    def block_domains(self, domains: List[str], force: bool = False) -> bool:
+    def block_domains(
+        self,
+        domains: List[str],
+        force: bool = False,
+        *,
+        _lines: Optional[List[str]] = None,
+        _existing: Optional[Set[str]] = None,
+    ) -> bool:
         """
         Block multiple domains efficiently with proper formatting.
-        Each domain gets its own line: 127.0.0.1 domain.com
-        
+        Entries are packed several domains per line: 127.0.0.1 a.com b.com ...
+
         Args:
             domains: List of domain names to block
             force: If True, re-add domains even if they appear blocked
+            _lines: Pre-read hosts lines, to skip re-reading the file
+            _existing: Pre-parsed blocked-domain set, to skip re-scanning
         """
         if not domains:
             return True
@@ -149,54 +218,84 @@ class HostsManager:
         try:
             # Backup before modification
             self.backup_hosts()
-            
-            # Read current hosts file
-            lines = self.read_hosts()
-            
+
             # Prepare domains to block (lowercase, stripped)
             domains_to_block = set(d.strip().lower() for d in domains if d.strip())
-            
+
             if not domains_to_block:
                 return True
-            
+
             # Get existing blocked domains
-            existing_blocked = self.get_blocked_domains() if not force else set()
-            
+            if force:
+                existing_blocked = set()
+            elif _existing is not None:
+                existing_blocked = _existing
+            else:
+                existing_blocked = self.get_blocked_domains()
+
             # Filter out already blocked domains (unless force)
             if not force:
                 domains_to_block = domains_to_block - existing_blocked
                 if not domains_to_block:
                     return True
-            
+
+                # Fast path: marker already in place and nothing needs removal,
+                # so append the new entries instead of rewriting the whole file
+                if self._marker_present:
+                    self._append_entries(domains_to_block)
+                    self._flush_dns_cache()
+                    return True
+
+            # Read current hosts file (unless the caller already did)
+            lines = _lines if _lines is not None else self.read_hosts()
+
             # Build new file content
             new_lines = []
             marker = "# DeepFocus entries"
             marker_found = False
             
-            for line in lines:
+            it = iter(lines)
+            for line in it:
                 line_stripped = line.strip()
-                
-                # Check for our marker
-                if marker in line:
+
+                # Check for our marker - only comment lines can contain it,
+                # so test the cheap '#' discriminator before the substring scan
+                if not marker_found and line_stripped.startswith("#") and marker in line:
                     marker_found = True
                     new_lines.append(line)
                     continue
-                
+
                 # Check for DeepFocus blocked entries
                 if line_stripped.startswith(self.redirect_ip):
                     parts = line.split()
-                    if len(parts) >= 2:
-                        # Extract domain from this line
-                        domain_in_line = parts[1].lower() if len(parts) > 1 else ""
-                        
-                        # If force mode, remove entries we're about to add
-                        if force and domain_in_line in domains_to_block:
-                            continue  # Skip - will re-add later
-                        
-                        # Check for malformed entries (very long or concatenated)
-                        if len(domain_in_line) > 60 or domain_in_line.count('.') > 5:
-                            continue  # Skip malformed entry
-                
+                    if len(parts) >= 2 and parts[0] == self.redirect_ip:
+                        # Entries may pack several domains per line - filter per token
+                        kept = []
+                        for token in parts[1:]:
+                            token_lower = token.lower()
+
+                            # If force mode, remove entries we're about to add
+                            if force and token_lower in domains_to_block:
+                                continue  # Skip - will re-add later
+
+                            # Check for malformed entries (very long or concatenated)
+                            if len(token_lower) > 60 or token_lower.count('.') > 5:
+                                continue  # Skip malformed entry
+
+                            kept.append(token)
+
+                        if not kept:
+                            continue  # Whole line consumed - drop it
+                        if len(kept) != len(parts) - 1:
+                            new_lines.append(f"{self.redirect_ip} {' '.join(kept)}\n")
+                            continue
+                elif marker_found:
+                    # Past the managed block - the rest is pure passthrough,
+                    # so copy it in bulk instead of re-checking every line
+                    new_lines.append(line)
+                    new_lines.extend(it)
+                    break
+
                 new_lines.append(line)
             
             # Ensure file ends with newline
@@ -207,25 +306,30 @@ class HostsManager:
             if not marker_found:
                 new_lines.append(f"\n{marker}\n")
             
-            # Add each domain on its own line with explicit newline
-            for domain in sorted(domains_to_block):
-                entry = f"{self.redirect_ip} {domain}\n"
-                new_lines.append(entry)
+            # Add entries packed several domains per line
+            # (hosts-file order is irrelevant, so no need to sort)
+            doms = list(domains_to_block)
+            for i in range(0, len(doms), MAX_DOMAINS_PER_LINE):
+                chunk = doms[i:i + MAX_DOMAINS_PER_LINE]
+                new_lines.append(f"{self.redirect_ip} {' '.join(chunk)}\n")
             
             # Write to hosts file
             was_readonly = self._make_writable()
-            
+
             try:
                 with open(self.hosts_path, "w", encoding="utf-8") as f:
                     f.writelines(new_lines)
             finally:
                 self._restore_readonly(was_readonly)
-            
+
+            # Marker was either found or just written
+            self._marker_present = True
+
             # Flush DNS cache for immediate effect
             self._flush_dns_cache()
-            
+
             return True
-            
+
         except PermissionError as e:
             raise PermissionError(
                 f"Cannot write to hosts file. Please run as Administrator. Error: {e}"
@@ -233,12 +337,40 @@ class HostsManager:
         except Exception as e:
             raise IOError(f"Failed to block domains: {e}")
 
-    def unblock_domains(self, domains: List[str]) -> bool:
+    def _append_entries(self, domains: Set[str]) -> None:
+        """Append redirect entries for the given domains to the hosts file.
+
+        Fast path for the common case where the DeepFocus marker already
+        exists and no lines need to be removed: O(new entries) of I/O
+        instead of rewriting the entire file.
+        """
+        was_readonly = self._make_writable()
+        try:
+            with open(self.hosts_path, "a+b") as f:
+                # Ensure we don't glue onto a final line missing its newline
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                doms = list(domains)
+                entries = "".join(
+                    f"{self.redirect_ip} {' '.join(doms[i:i + MAX_DOMAINS_PER_LINE])}\n"
+                    for i in range(0, len(doms), MAX_DOMAINS_PER_LINE)
+                )
+                f.write(entries.encode("utf-8"))
+        finally:
+            self._restore_readonly(was_readonly)
+
+    def unblock_domains(
+        self, domains: List[str], *, _lines: Optional[List[str]] = None
+    ) -> bool:
         """
         Unblock multiple domains efficiently.
-        
+
         Args:
             domains: List of domain names to unblock
+            _lines: Pre-read hosts lines, to skip re-reading the file
         """
         if not domains:
             return True
@@ -246,9 +378,9 @@ class HostsManager:
         try:
             # Backup before modification
             self.backup_hosts()
-            
-            # Read current hosts file
-            lines = self.read_hosts()
+
+            # Read current hosts file (unless the caller already did)
+            lines = _lines if _lines is not None else self.read_hosts()
             
             # Prepare domains to unblock (lowercase, stripped)
             domains_to_unblock = set(d.strip().lower() for d in domains if d.strip())
@@ -266,13 +398,15 @@ class HostsManager:
                 # Check for DeepFocus blocked entries
                 if line_stripped.startswith(self.redirect_ip):
                     parts = line.split()
-                    if len(parts) >= 2:
-                        domain_in_line = parts[1].lower() if len(parts) > 1 else ""
-                        
-                        if domain_in_line in domains_to_unblock:
+                    if len(parts) >= 2 and parts[0] == self.redirect_ip:
+                        # Entries may pack several domains per line - filter per token
+                        kept = [t for t in parts[1:] if t.lower() not in domains_to_unblock]
+                        if len(kept) != len(parts) - 1:
                             modified = True
-                            continue  # Skip this line (remove the block)
-                
+                            if kept:
+                                new_lines.append(f"{self.redirect_ip} {' '.join(kept)}\n")
+                            continue  # Original line removed or rewritten
+
                 new_lines.append(line)
             
             if not modified:
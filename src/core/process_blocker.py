@@ -1,6 +1,7 @@
 """
 Process-based blocking - Prevents specific browsers/apps from running.
 """
+import logging
 import subprocess
 import platform
 import time
@@ -9,6 +10,8 @@ from typing import Set
 
 from ..config.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessBlocker:
     """Blocks specific processes (browsers) from running."""
@@ -38,17 +41,17 @@ class ProcessBlocker:
             return True
         
         if platform.system() != "Windows":
-            print("Process blocker: Windows only feature")
+            logger.info("Windows only feature")
             return False
         
         try:
             self.running = True
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
-            print("Process blocker: Started")
+            logger.info("Started")
             return True
         except Exception as e:
-            print(f"Process blocker: Failed to start: {e}")
+            logger.error("Failed to start: %s", e)
             return False
     
     def stop(self) -> None:
@@ -56,7 +59,7 @@ class ProcessBlocker:
         self.running = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
-        print("Process blocker: Stopped")
+        logger.info("Stopped")
     
     def _monitor_loop(self) -> None:
         """Monitor and kill blocked processes."""
@@ -65,7 +68,7 @@ class ProcessBlocker:
                 self._kill_blocked_processes()
                 time.sleep(2)  # Check every 2 seconds
             except Exception as e:
-                print(f"Process blocker: Error: {e}")
+                logger.error("Monitor error: %s", e)
                 time.sleep(5)
     
     def _kill_blocked_processes(self) -> None:
@@ -98,11 +101,11 @@ class ProcessBlocker:
                                     capture_output=True,
                                     creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
                                 )
-                                print(f"Process blocker: Killed {process_name}")
+                                logger.debug("Killed %s", process_name)
                         except Exception as e:
-                            print(f"Process blocker: Error killing {process_name}: {e}")
+                            logger.debug("Error killing %s: %s", process_name, e)
         except Exception as e:
-            print(f"Process blocker: Error checking processes: {e}")
+            logger.error("Error checking processes: %s", e)
 
 
 # Global process blocker instance
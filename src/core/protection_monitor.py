@@ -1,15 +1,19 @@
 """
 Advanced protection monitor - prevents manual hosts file editing and re-applies blocks.
 """
+import logging
+import stat
 import threading
 import time
 from typing import Set
 from pathlib import Path
 
-from ..config.constants import PLATFORM_DOMAINS, ADULT_CONTENT_DOMAINS
+from ..config.constants import PLATFORM_DOMAINS, ADULT_CONTENT_DOMAINS_SET
 from ..config.settings import settings
 from .hosts_manager import HostsManager
 
+logger = logging.getLogger(__name__)
+
 
 class ProtectionMonitor:
     """Monitors hosts file and re-applies blocks if manually removed."""
@@ -38,7 +42,7 @@ class ProtectionMonitor:
         self.running = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
-        print("Protection monitor: Stopped")
+        logger.info("Stopped")
     
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
@@ -57,66 +61,48 @@ class ProtectionMonitor:
         """Check hosts file and re-apply blocks if needed, but respect unblocked platforms.
         Optimized for memory and CPU usage - only checks what's necessary."""
         try:
-            # Get current blocked domains from hosts file (cache result)
+            # Read and parse the hosts file once per tick; the parsed state is
+            # handed to the batched write calls below so they don't re-read it
+            lines = self.hosts_manager.read_hosts()
             current_blocked = self.hosts_manager.get_blocked_domains()
-            
-            # Track if any changes were made to avoid unnecessary DNS flush
-            changes_made = False
-            
-            # Check platforms - only re-apply if settings say they should be blocked
+
+            # Snapshot settings once per tick instead of querying per platform
+            blocked_flags = {p: settings.is_platform_blocked(p) for p in PLATFORM_DOMAINS}
+            adult_blocked = settings.is_adult_content_blocked()
+
+            # Collect everything that needs fixing, then write at most twice
+            to_block = []
+            to_unblock = []
+
             for platform, domains in PLATFORM_DOMAINS.items():
-                if settings.is_platform_blocked(platform):
+                if blocked_flags[platform]:
                     # Only re-apply if platform should be blocked in settings
-                    missing_domains = [d for d in domains if d not in current_blocked]
-                    if missing_domains:
-                        try:
-                            # Use batch blocking for better performance
-                            if len(missing_domains) == len(domains):
-                                # All domains missing - use platform blocking method
-                                from .blocker import Blocker
-                                blocker = Blocker()
-                                blocker.block_platform(platform, force=True)
-                            else:
-                                # Some domains missing - block individually but in batch
-                                self.hosts_manager.block_domains(missing_domains)
-                            changes_made = True
-                        except Exception:
-                            pass
+                    to_block.extend(d for d in domains if d not in current_blocked)
                 else:
                     # Platform should be unblocked - ensure it stays unblocked
-                    blocked_domains_for_platform = [d for d in domains if d in current_blocked]
-                    if blocked_domains_for_platform:
-                        try:
-                            self.hosts_manager.unblock_domains(blocked_domains_for_platform)
-                            changes_made = True
-                        except Exception:
-                            pass
-            
-            # Check adult content (only if enabled to save CPU)
-            if settings.is_adult_content_blocked():
-                missing_adult = [d for d in ADULT_CONTENT_DOMAINS if d not in current_blocked]
-                if missing_adult:
-                    try:
-                        # Use batch blocking for better performance
-                        self.hosts_manager.block_domains(missing_adult)
-                        changes_made = True
-                    except Exception:
-                        pass
+                    to_unblock.extend(d for d in domains if d in current_blocked)
+
+            # C-level set arithmetic instead of a per-domain generator scan
+            if adult_blocked:
+                to_block.extend(ADULT_CONTENT_DOMAINS_SET - current_blocked)
             else:
-                # Adult content should be unblocked - ensure it stays unblocked
-                blocked_adult = [d for d in ADULT_CONTENT_DOMAINS if d in current_blocked]
-                if blocked_adult:
-                    try:
-                        # Unblock in batches for better performance
-                        self.hosts_manager.unblock_domains(blocked_adult)
-                        changes_made = True
-                    except Exception:
-                        pass
-            
-            # Only flush DNS cache if changes were actually made (optimization)
-            if changes_made:
-                self.hosts_manager._flush_dns_cache()
-                        
+                to_unblock.extend(ADULT_CONTENT_DOMAINS_SET & current_blocked)
+
+            if to_unblock:
+                try:
+                    self.hosts_manager.unblock_domains(to_unblock, _lines=lines)
+                    lines = None  # File changed - the buffer is stale now
+                except Exception:
+                    pass
+
+            if to_block:
+                try:
+                    self.hosts_manager.block_domains(
+                        to_block, _lines=lines, _existing=current_blocked
+                    )
+                except Exception:
+                    pass
+
         except Exception:
             pass
     
@@ -129,11 +115,7 @@ class ProtectionMonitor:
         try:
             if not self.hosts_manager.is_admin():
                 return False
-            
-            import os
-            import stat
-            from pathlib import Path
-            
+
             hosts_path = self.hosts_manager.hosts_path
             
             if not hosts_path.exists():
@@ -143,7 +125,7 @@ class ProtectionMonitor:
             current_permissions = hosts_path.stat().st_mode
             hosts_path.chmod(stat.S_IREAD)  # Read-only
             
-            print("Protection monitor: Hosts file set to read-only")
+            logger.info("Hosts file set to read-only")
             
             # Note: Our app needs to temporarily make it writable when modifying
             # This is handled in hosts_manager
@@ -155,7 +137,6 @@ class ProtectionMonitor:
     def _unprotect_hosts_file_for_write(self) -> bool:
         """Temporarily make hosts file writable for our app."""
         try:
-            import stat
             hosts_path = self.hosts_manager.hosts_path
             if hosts_path.exists():
                 hosts_path.chmod(stat.S_IREAD | stat.S_IWRITE)
@@ -167,7 +148,6 @@ class ProtectionMonitor:
     def _reprotect_hosts_file(self) -> bool:
         """Make hosts file read-only again after write."""
         try:
-            import stat
             hosts_path = self.hosts_manager.hosts_path
             if hosts_path.exists():
                 hosts_path.chmod(stat.S_IREAD)
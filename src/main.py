@@ -5,39 +5,86 @@ Simplified and optimized.
 import flet as ft
 import sys
 import os
+import time
 import asyncio
+import logging
 import platform
+from importlib import import_module
 from pathlib import Path
 
 # Add current and parent directories to path for imports
 _current_dir = Path(__file__).resolve().parent
-if str(_current_dir) not in sys.path:
-    sys.path.insert(0, str(_current_dir))
-if str(_current_dir.parent) not in sys.path:
-    sys.path.insert(0, str(_current_dir.parent))
+_known_paths = set(sys.path)
+for _p in (str(_current_dir), str(_current_dir.parent)):
+    if _p not in _known_paths:
+        sys.path.insert(0, _p)
+del _known_paths
 
-# Import application modules
+# Tray icon path, resolved (and stat'd) once at import
+_ICON_PATH = _current_dir / "assets" / "icon.ico"
+_ICON_PATH_STR = str(_ICON_PATH) if _ICON_PATH.exists() else None
+
+# platform.system() shells out to uname on some platforms; ask once
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Import application modules needed before login; the dashboard pages and
+# blocking engine are imported lazily so the login screen doesn't pay for them.
+# The package prefix is resolved exactly once here - every later lazy import
+# goes through _app_import instead of repeating the try/except ladder. There
+# is deliberately no spec_from_file_location last resort: with the two path
+# entries above, the normal import machinery resolves every module in one
+# cached FileFinder pass.
 try:
     from .ui.login_page import create_login_page
-    from .ui.main_page import MainPage
-    from .ui.custom_domain_page import CustomDomainPage
-    from .ui.settings_page import SettingsPage
     from .utils.language import lang
     from .utils.system_integration import system_integration, stop_tray_icon
-    from .core.blocker import Blocker
     from .config.colors import PRIMARY, WARNING, ERROR
     from .config.settings import settings
+    _PKG = __package__
 except ImportError:
     # Fallback for direct execution
     from src.ui.login_page import create_login_page
-    from src.ui.main_page import MainPage
-    from src.ui.custom_domain_page import CustomDomainPage
-    from src.ui.settings_page import SettingsPage
     from src.utils.language import lang
     from src.utils.system_integration import system_integration, stop_tray_icon
-    from src.core.blocker import Blocker
     from src.config.colors import PRIMARY, WARNING, ERROR
     from src.config.settings import settings
+    _PKG = "src"
+
+
+def _error_view(message: str) -> ft.Container:
+    """Build the error page shown by App and the startup handler."""
+    return ft.Container(
+        content=ft.Column(
+            controls=[
+                ft.Text("Application Error", size=24, weight=ft.FontWeight.BOLD),
+                ft.Text(message, size=12),
+            ],
+            spacing=10,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        ),
+        alignment=ft.alignment.center,
+        expand=True,
+        padding=40,
+    )
+
+
+_theme = None
+
+
+def _default_theme() -> ft.Theme:
+    """Build the application theme once and reuse it across App instances."""
+    global _theme
+    if _theme is None:
+        _theme = ft.Theme(font_family="Segoe UI", color_scheme_seed=PRIMARY)
+    return _theme
+
+
+def _app_import(name: str):
+    """Import an application submodule using the prefix resolved at startup."""
+    full_name = f"{_PKG}.{name}" if _PKG else name
+    # Already-loaded modules skip the import machinery entirely
+    module = sys.modules.get(full_name)
+    return module if module is not None else import_module(full_name)
 
 
 class App:
@@ -47,7 +94,9 @@ class App:
         self.page = page
         self.page.title = "DeepFocus"
         
-        # Window properties
+        # Window properties. Stay hidden until main() has centered the
+        # window and flushed the first frame - no half-painted flash.
+        self.page.window.visible = False
         self.page.window.width = 800
         self.page.window.height = 700
         self.page.window.min_width = 600
@@ -56,55 +105,61 @@ class App:
         self.page.window.prevent_close = True
         
         # Window close handler - minimize to tray
-        def on_window_event(e):
-            try:
-                is_close = (
-                    (hasattr(e, 'data') and e.data == "close") or
-                    str(e).lower().find("close") != -1
-                )
-                if is_close:
-                    self.page.window.visible = False
-                    self.page.update()
-            except Exception:
-                pass
-        
-        self.page.window.on_event = on_window_event
+        self.page.window.on_event = self._on_window_event
         
         # Tray icon reference
         self.tray_icon = None
         
         # Theme
         self.page.theme_mode = ft.ThemeMode.SYSTEM
-        self.page.theme = ft.Theme(font_family="Segoe UI", color_scheme_seed=PRIMARY)
+        self.page.theme = _default_theme()
         
+        # Lazily constructed blocking engine, shared by every caller
+        self._blocker = None
+
         # Page state
         self.current_page = None
         self.is_logged_in = False
+        self._last_nav_ts = 0.0
+        # route -> (page object, built container, language it was built in)
+        self._page_cache = {}
         
         # Initialize language
         lang.set_language(lang.get_current_language())
         
         # Setup navigation
+        self._routes = {
+            "main": self._show_main_page,
+            "custom_domains": self._show_custom_domains_page,
+            "settings": self._show_settings_page,
+        }
         self.page.on_navigate = self._handle_navigation
         
         # Show login page
         self._show_login_page()
-        
-        # Initialize after UI shows
-        self._initialize_services()
+
+    def _on_window_event(self, e) -> None:
+        """Minimize to tray on close. Fires for every window event
+        (move, resize, focus), so the close test is a single attribute
+        compare - no per-event str(e) allocation."""
+        try:
+            if getattr(e, "data", None) == "close":
+                self.page.window.visible = False
+                self.page.update()
+        except (AttributeError, RuntimeError):
+            # Flet raises these when the page is tearing down mid-event
+            pass
 
     def _initialize_services(self) -> None:
-        """Initialize background services."""
+        """Initialize background services (scheduled after first paint)."""
         try:
-            blocker = Blocker()
-            if not blocker.is_admin():
+            # Cheap ctypes probe - importing the blocking engine just to ask
+            # "am I admin?" would drag core.blocker in before login
+            if not system_integration.check_admin_privileges():
                 self._show_admin_warning()
             else:
                 # Start protection
-                try:
-                    from .core.protection_monitor import protection_monitor
-                except ImportError:
-                    from src.core.protection_monitor import protection_monitor
+                protection_monitor = _app_import("core.protection_monitor").protection_monitor
                 protection_monitor.start()
                 protection_monitor.protect_hosts_file()
                 
@@ -113,10 +168,11 @@ class App:
         except Exception:
             pass
         
-        # Enable auto-start
+        # Enable auto-start; skip the registry write when the Run key is
+        # already in place and the saved setting agrees
         try:
-            app_path = system_integration.get_app_path()
-            system_integration.set_auto_start(True, app_path)
+            if not (settings.is_auto_start() and system_integration.is_auto_start_enabled()):
+                system_integration.set_auto_start(True, system_integration.get_app_path())
             if not settings.is_auto_start():
                 settings.set_auto_start(True)
         except Exception:
@@ -126,25 +182,43 @@ class App:
         """Setup system tray icon."""
         def show_window():
             try:
-                self.page.window.visible = True
-                self.page.window.minimized = False
-                self.page.update()
-            except Exception:
+                window = self.page.window
+                changed = False
+                if not window.visible:
+                    window.visible = True
+                    changed = True
+                if window.minimized:
+                    window.minimized = False
+                    changed = True
+                # Clicking Show while the window is already up skips the
+                # full-tree update entirely
+                if changed:
+                    self.page.update()
+            except (AttributeError, RuntimeError):
                 pass
 
         def quit_app():
+            # Close the window first so Flet runs its teardown, then wait
+            # for the tray thread handshake, then flush state explicitly.
             try:
-                stop_tray_icon()
                 self.page.window.close()
+            except (AttributeError, RuntimeError):
+                pass
+            try:
+                stop_tray_icon()
             except Exception:
                 pass
+            try:
+                settings.save()
+            except Exception:
+                pass
+            # This callback runs on the tray thread, where sys.exit would
+            # only end that thread - hard-exit after the cleanups above
             os._exit(0)
 
-        icon_path = _current_dir / "assets" / "icon.ico"
-        
         try:
             self.tray_icon = system_integration.create_system_tray(
-                icon_path=str(icon_path) if icon_path.exists() else None,
+                icon_path=_ICON_PATH_STR,
                 show_callback=show_window,
                 quit_callback=quit_app,
                 menu_title="DeepFocus",
@@ -152,14 +226,23 @@ class App:
         except Exception:
             pass
 
+    def _swap_content(self, container: ft.Control) -> None:
+        """Swap the page content with a single update round-trip.
+
+        page.add() pushes its own update, so appending directly and
+        calling update() once halves the renderer traffic per navigation.
+        """
+        self.page.controls.clear()
+        self.page.controls.append(container)
+        self.page.update()
+
     def _show_login_page(self) -> None:
         """Show login page."""
         try:
             self.is_logged_in = False
+            self.current_page = "login"
             login_container = create_login_page(self.page, self._on_login_success)
-            self.page.controls.clear()
-            self.page.add(login_container)
-            self.page.update()
+            self._swap_content(login_container)
         except Exception as e:
             self._show_error_page(f"Error loading login: {e}")
 
@@ -167,60 +250,97 @@ class App:
         """Handle successful login."""
         try:
             self.is_logged_in = True
-            
-            # Apply blocking after login
-            try:
-                blocker = Blocker()
-                if blocker.is_admin():
-                    blocker.sync_with_hosts_file()
-            except Exception as e:
-                self._show_snackbar(f"Error applying blocking: {e}", ERROR)
-            
+
+            # Show the dashboard immediately; hosts-file I/O runs off-thread
             self._show_main_page()
+
+            try:
+                self.page.run_thread(self._apply_blocking)
+            except Exception:
+                self._apply_blocking()
         except Exception as e:
             self._show_snackbar(f"Error after login: {e}", ERROR)
 
+    def _get_blocker(self):
+        """Construct the blocking engine on first use and reuse it afterwards."""
+        if self._blocker is None:
+            self._blocker = _app_import("core.blocker").Blocker()
+        return self._blocker
+
+    def _apply_blocking(self) -> None:
+        """Apply saved blocking state to the hosts file (runs off the UI thread)."""
+        try:
+            blocker = self._get_blocker()
+            if blocker.is_admin():
+                blocker.sync_with_hosts_file()
+        except Exception as e:
+            self._show_snackbar(f"Error applying blocking: {e}", ERROR)
+
+    def _show_cached_page(self, route: str) -> bool:
+        """Re-attach a cached page for the route; True if one was shown.
+
+        Cached containers are reused only if they were built in the
+        current language; on_show() lets the page refresh dynamic state
+        (card badges, domain list) before the single update.
+        """
+        cached = self._page_cache.get(route)
+        if not cached or cached[2] != lang.get_current_language():
+            return False
+        page_obj, container, _ = cached
+        try:
+            page_obj.on_show()
+        except Exception:
+            return False
+        self._swap_content(container)
+        return True
+
     def _show_main_page(self) -> None:
         """Show main dashboard page."""
         try:
-            main_page = MainPage(self.page)
             self.current_page = "main"
+            if self._show_cached_page("main"):
+                return
+            main_page = _app_import("ui.main_page").MainPage(self.page)
             main_container = main_page.create_page()
-            self.page.controls.clear()
-            self.page.add(main_container)
-            self.page.update()
+            self._page_cache["main"] = (main_page, main_container, lang.get_current_language())
+            self._swap_content(main_container)
         except Exception as e:
             self._show_snackbar(f"Error loading main page: {e}", ERROR)
 
     def _show_custom_domains_page(self) -> None:
         """Show custom domains page."""
         try:
-            custom_page = CustomDomainPage(self.page)
             self.current_page = "custom_domains"
+            if self._show_cached_page("custom_domains"):
+                return
+            custom_page = _app_import("ui.custom_domain_page").CustomDomainPage(self.page)
             custom_container = custom_page.create_page()
-            self.page.controls.clear()
-            self.page.add(custom_container)
-            self.page.update()
+            self._page_cache["custom_domains"] = (
+                custom_page, custom_container, lang.get_current_language()
+            )
+            self._swap_content(custom_container)
         except Exception:
             pass
 
     def _show_settings_page(self) -> None:
         """Show settings page."""
-        settings_page = SettingsPage(self.page)
+        settings_page = _app_import("ui.settings_page").SettingsPage(self.page)
         self.current_page = "settings"
         settings_container = settings_page.create_page()
-        self.page.controls.clear()
-        self.page.add(settings_container)
-        self.page.update()
+        self._swap_content(settings_container)
 
     def _handle_navigation(self, route: str) -> None:
         """Handle navigation between pages."""
-        if route == "main":
-            self._show_main_page()
-        elif route == "custom_domains":
-            self._show_custom_domains_page()
-        elif route == "settings":
-            self._show_settings_page()
+        # Drop rapid duplicate events for the route we're already on
+        # (double clicks, tray + keyboard handlers firing together)
+        now = time.monotonic()
+        if route == self.current_page and now - self._last_nav_ts < 0.25:
+            return
+        self._last_nav_ts = now
+
+        show = self._routes.get(route)
+        if show:
+            show()
 
     def _show_admin_warning(self) -> None:
         """Show warning about admin privileges."""
@@ -229,6 +349,10 @@ class App:
     def _show_snackbar(self, message: str, color) -> None:
         """Show a snackbar message."""
         try:
+            # No page content yet means nothing to anchor the toast to;
+            # skip the extra frame rather than flush an empty tree
+            if not self.page.controls:
+                return
             self.page.snack_bar = ft.SnackBar(content=ft.Text(message), bgcolor=color, duration=5000)
             self.page.snack_bar.open = True
             self.page.update()
@@ -237,80 +361,88 @@ class App:
 
     def _show_error_page(self, message: str) -> None:
         """Show error page."""
-        self.page.controls.clear()
-        self.page.add(
-            ft.Container(
-                content=ft.Column(
-                    controls=[
-                        ft.Text("Application Error", size=24, weight=ft.FontWeight.BOLD),
-                        ft.Text(message, size=12),
-                    ],
-                    spacing=10,
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                ),
-                alignment=ft.alignment.center,
-                expand=True,
-                padding=40,
-            )
-        )
-        self.page.update()
+        self._swap_content(_error_view(message))
 
 
 async def main(page: ft.Page):
     """Main entry point for Flet app."""
+    # Debug/info logs from the core modules stay disabled unless opted in
+    logging.basicConfig(level=logging.WARNING)
     try:
         start_minimized = "--minimized" in sys.argv or os.getenv("DEEPFOCUS_MINIMIZED", "").lower() == "true"
         
         app = App(page)
         
-        await asyncio.sleep(0.1)
+        # One yield lets the freshly added controls reach the renderer;
+        # a fixed 100ms nap here just delayed every launch
+        await asyncio.sleep(0)
         await page.window.center()
         
         page.window.visible = not start_minimized
         page.update()
-        
+
+        # Tray, protection monitor, and auto-start all touch the registry
+        # or filesystem; run them off-thread after the first paint. The
+        # loop only weak-refs tasks, so keep a strong reference or the
+        # init task can be garbage-collected before it runs.
+        app._init_task = asyncio.create_task(asyncio.to_thread(app._initialize_services))
+
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        # Frame-chain formatting is debug-only; the error page below is
+        # what the user actually sees
+        if os.environ.get("DEEPFOCUS_DEBUG"):
+            import traceback
+            traceback.print_exc()
         try:
             page.controls.clear()
-            page.add(
-                ft.Container(
-                    content=ft.Column(
-                        controls=[
-                            ft.Text("Application Error", size=24, weight=ft.FontWeight.BOLD),
-                            ft.Text(str(e), size=12),
-                        ],
-                        spacing=10,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    alignment=ft.alignment.center,
-                    expand=True,
-                    padding=40,
-                )
-            )
+            page.controls.append(_error_view(str(e)))
             page.window.visible = True
             page.update()
-        except:
+        except Exception:
             pass
 
 
+# Single-instance mutex handle, held for the process lifetime
+_single_instance_mutex = None
+
+ERROR_ALREADY_EXISTS = 183
+
+
 def check_single_instance() -> bool:
     """Prevent multiple instances on Windows."""
-    if platform.system() != "Windows":
+    global _single_instance_mutex
+    if not _IS_WINDOWS:
         return True
     try:
-        import win32event
-        import win32api
-        from winerror import ERROR_ALREADY_EXISTS
-        
-        mutex_name = "Global\\DeepFocus_SingleInstance_Mutex"
-        mutex = win32event.CreateMutex(None, False, mutex_name)
-        
-        if win32api.GetLastError() == ERROR_ALREADY_EXISTS:
+        import atexit
+        import ctypes
+        import getpass
+        from ctypes import wintypes
+
+        # kernel32 is already loaded in every Windows process, so this
+        # skips the pywin32 DLL chain the old win32event path dragged in.
+        # use_last_error snapshots GetLastError at the FFI boundary -
+        # calling kernel32.GetLastError() later can read a value ctypes
+        # itself has already clobbered.
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateMutexW.restype = wintypes.HANDLE
+        kernel32.CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+        # Local\ scopes the mutex to this logon session, so a second user
+        # on the same host (RDP / fast user switching) gets their own gate
+        mutex_name = f"Local\\DeepFocus_SingleInstance_{getpass.getuser()}"
+        handle = kernel32.CreateMutexW(None, False, mutex_name)
+        if not handle:
+            # CreateMutexW failed outright - don't hold a bogus lock
+            return True
+
+        if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            kernel32.CloseHandle(handle)
             os._exit(1)
-        return True
-    except ImportError:
+
+        _single_instance_mutex = handle
+        atexit.register(kernel32.CloseHandle, handle)
         return True
     except Exception:
         return True
@@ -318,44 +450,39 @@ def check_single_instance() -> bool:
 
 def request_admin_elevation() -> bool:
     """Request admin elevation on Windows (for frozen exe only)."""
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
+        return True
+
+    # The auto-restart below only fires for frozen builds, so dev runs
+    # skip the shell32 load and admin syscall entirely
+    if not getattr(sys, 'frozen', False):
         return True
-    
+
     try:
         import ctypes
         if ctypes.windll.shell32.IsUserAnAdmin() != 0:
             return True
-        
-        # Only auto-restart if running as EXE
-        if getattr(sys, 'frozen', False):
-            exe_path = sys.executable
-            args = sys.argv[1:] if len(sys.argv) > 1 else []
-            args_str = " ".join(f'"{arg}"' if " " in arg else arg for arg in args)
-            
-            result = ctypes.windll.shell32.ShellExecuteW(None, "runas", exe_path, args_str, None, 1)
-            
-            if result > 32:
-                sys.exit(0)
+
+        import subprocess
+        exe_path = sys.executable
+        # list2cmdline follows the MSVCRT quoting rules (embedded quotes,
+        # trailing backslashes) that the old join-with-quotes missed
+        args_str = subprocess.list2cmdline(sys.argv[1:])
+
+        result = ctypes.windll.shell32.ShellExecuteW(None, "runas", exe_path, args_str, None, 1)
+
+        if result > 32:
+            sys.exit(0)
         return False
     except Exception:
         return False
 
 
 if __name__ == "__main__":
-    # Prevent multiple instances
-    check_single_instance()
-    
-    # Request admin on Windows
-    if platform.system() == "Windows":
+    # Windows-only startup gates: single instance, then admin elevation
+    if _IS_WINDOWS:
+        check_single_instance()
         request_admin_elevation()
-    
-    # Enable auto-start
-    try:
-        app_path = system_integration.get_app_path()
-        system_integration.set_auto_start(True, app_path)
-        settings.set_auto_start(True)
-    except Exception:
-        pass
-    
-    # Run app
+
+    # Run app (auto-start is enabled by _initialize_services after startup)
     ft.run(main)
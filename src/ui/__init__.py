@@ -0,0 +1,28 @@
+"""
+UI package with lazy (PEP 562) page exports.
+
+Importing this package stays cheap: a page class is only imported the
+first time it is looked up as an attribute, then cached in the module
+namespace so later lookups skip the hook entirely.
+"""
+
+_LAZY_EXPORTS = {
+    "create_login_page": ("login_page", "create_login_page"),
+    "MainPage": ("main_page", "MainPage"),
+    "CustomDomainPage": ("custom_domain_page", "CustomDomainPage"),
+    "SettingsPage": ("settings_page", "SettingsPage"),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
@@ -7,6 +7,19 @@ from typing import Callable
 from ...utils.language import lang
 from ...config.colors import BLOCKED, UNBLOCKED, PRIMARY, TRANSPARENT, GREY_300, GREY_400
 
+# (blocked, unblocked) labels per language - every card on the dashboard
+# shares the same two strings, so translate them once per language
+_STATUS_LABELS = {}
+
+
+def _status_labels() -> tuple:
+    key = lang.get_current_language()
+    pair = _STATUS_LABELS.get(key)
+    if pair is None:
+        pair = (lang.translate("blocked"), lang.translate("unblocked"))
+        _STATUS_LABELS[key] = pair
+    return pair
+
 
 def create_platform_card(
     platform: str,
@@ -17,7 +30,8 @@ def create_platform_card(
     page: ft.Page,
 ) -> ft.Card:
     """Create a platform card with toggle switch."""
-    status_text = lang.translate("blocked") if is_blocked else lang.translate("unblocked")
+    blocked_label, unblocked_label = _status_labels()
+    status_text = blocked_label if is_blocked else unblocked_label
     
     toggle = ft.Switch(
         value=is_blocked,
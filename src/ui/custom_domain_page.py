@@ -1,6 +1,8 @@
 """
 Custom domain management page - Simplified.
 """
+import threading
+
 import flet as ft
 
 from ..core.blocker import Blocker
@@ -17,6 +19,13 @@ class CustomDomainPage:
         self.page = page
         self.blocker = Blocker()
         self.domain_list_view = None
+        self._empty_tile = None
+        # Adds queued within the debounce window; flushed as one write.
+        # The lock covers queue and timer - they're touched from both the
+        # UI thread and the timer thread.
+        self._pending_adds = []
+        self._flush_timer = None
+        self._pending_lock = threading.Lock()
 
     def create_page(self) -> ft.Container:
         """Create the custom domain page UI."""
@@ -56,8 +65,10 @@ class CustomDomainPage:
 
         input_section = ft.Row(controls=[domain_input, add_button], spacing=10)
 
-        # Domain list view
-        self.domain_list_view = ft.Column(controls=[], spacing=0, scroll=ft.ScrollMode.AUTO)
+        # Domain list view. ListView virtualizes rows - with a fixed
+        # item_extent only the tiles inside the viewport get rendered,
+        # so large domain lists don't pay for offscreen widgets.
+        self.domain_list_view = ft.ListView(spacing=0, item_extent=56)
         
         domain_list_container = ft.Card(
             content=ft.Container(
@@ -84,9 +95,13 @@ class CustomDomainPage:
         
         # Refresh domain list
         self._refresh_domain_list()
-        
+
         return ft.Container(content=content, padding=20, expand=True)
 
+    def on_show(self) -> None:
+        """Refresh the domain list when a cached instance is re-shown."""
+        self._refresh_domain_list()
+
     def _add_domain(self, domain_input: ft.TextField) -> None:
         """Add a custom domain."""
         domain = domain_input.value.strip()
@@ -109,14 +124,55 @@ class CustomDomainPage:
             self._show_error(lang.translate("admin_required_msg"))
             return
 
-        success, error_msg = self.blocker.block_custom_domain(domain)
-        
+        # Coalesce rapid adds into one hosts-file rewrite: each add
+        # restarts a short timer and the whole batch is written together
+        with self._pending_lock:
+            duplicate = domain in self._pending_adds
+            if not duplicate:
+                self._pending_adds.append(domain)
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                timer = threading.Timer(0.25, self._schedule_flush)
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
+
+        if duplicate:
+            self._show_error(lang.translate("domain_already_exists"))
+            return
+
+        domain_input.value = ""
+        self.page.update()
+
+    def _schedule_flush(self) -> None:
+        """Timer callback: hand the flush to a page-managed worker thread."""
+        try:
+            self.page.run_thread(self._flush_pending_adds)
+        except Exception:
+            self._flush_pending_adds()
+
+    def _flush_pending_adds(self) -> None:
+        """Write every queued domain with a single hosts-file update."""
+        with self._pending_lock:
+            batch, self._pending_adds = self._pending_adds, []
+            self._flush_timer = None
+        if not batch:
+            return
+
+        success, error_msg = self.blocker.block_custom_domains(batch)
+
         if success:
-            domain_input.value = ""
             self._refresh_domain_list()
+            # _show_success flushes the page, so no second update here
             self._show_success(lang.translate("domain_added"))
-            self.page.update()
         else:
+            # The input was cleared when these were queued, so a failed
+            # write (e.g. PermissionError) must not lose them - put the
+            # batch back at the head of the queue for the next flush
+            with self._pending_lock:
+                self._pending_adds[:0] = [
+                    d for d in batch if d not in self._pending_adds
+                ]
             self._show_error(error_msg or lang.translate("error"))
 
     def _remove_domain(self, domain: str) -> None:
@@ -130,39 +186,43 @@ class CustomDomainPage:
         if success:
             self._refresh_domain_list()
             self._show_success(lang.translate("domain_removed"))
-            self.page.update()
         else:
             self._show_error(error_msg or lang.translate("error"))
 
+    def _make_domain_tile(self, domain: str, remove_label: str) -> ft.ListTile:
+        """Build one domain row with its delete button."""
+        return ft.ListTile(
+            leading=ft.Icon(ft.Icons.LANGUAGE, color=PRIMARY),
+            title=ft.Text(domain),
+            trailing=ft.IconButton(
+                icon=ft.Icons.DELETE,
+                icon_color=ERROR,
+                tooltip=remove_label,
+                on_click=lambda e, d=domain: self._remove_domain(d),
+            ),
+        )
+
     def _refresh_domain_list(self) -> None:
         """Refresh the domain list display."""
         if not self.domain_list_view:
             return
 
-        self.domain_list_view.controls.clear()
         custom_domains = self.blocker.get_custom_domains()
 
         if not custom_domains:
-            empty_tile = ft.ListTile(
-                leading=ft.Icon(ft.Icons.LANGUAGE, color=GREY_600, opacity=0.5),
-                title=ft.Text(lang.translate("no_custom_domains"), color=GREY_600),
-            )
-            self.domain_list_view.controls.append(empty_tile)
-        else:
-            for domain in custom_domains:
-                delete_button = ft.IconButton(
-                    icon=ft.Icons.DELETE,
-                    icon_color=ERROR,
-                    tooltip=lang.translate("remove_button"),
-                    on_click=lambda e, d=domain: self._remove_domain(d),
-                )
-                
-                list_tile = ft.ListTile(
-                    leading=ft.Icon(ft.Icons.LANGUAGE, color=PRIMARY),
-                    title=ft.Text(domain),
-                    trailing=delete_button,
+            if self._empty_tile is None:
+                self._empty_tile = ft.ListTile(
+                    leading=ft.Icon(ft.Icons.LANGUAGE, color=GREY_600, opacity=0.5),
+                    title=ft.Text(lang.translate("no_custom_domains"), color=GREY_600),
                 )
-                self.domain_list_view.controls.append(list_tile)
+            tiles = [self._empty_tile]
+        else:
+            # Tooltip translated once, not once per row
+            remove_label = lang.translate("remove_button")
+            tiles = [self._make_domain_tile(d, remove_label) for d in custom_domains]
+
+        # Single list assignment - one reconciler pass instead of one per append
+        self.domain_list_view.controls = tiles
 
     def _show_error(self, message: str) -> None:
         """Show error message."""
@@ -89,11 +89,11 @@ def _handle_login(
     # Get password and strip whitespace
     password = password_field.value.strip() if password_field.value else ""
     
-    # Clear previous errors
+    # Clear previous errors; every branch below ends with its own
+    # page.update(), so no intermediate frame is flushed here
     error_text.visible = False
     error_text.value = ""
-    page.update()
-    
+
     # Validate password is not empty
     if not password:
         error_text.value = lang.translate("login_required")
@@ -104,11 +104,9 @@ def _handle_login(
     # Verify password
     try:
         if auth.verify_main_password(password):
-            # Success - hide error and proceed
-            error_text.visible = False
-            error_text.value = ""
+            # Success - the callback navigates away and pushes its own
+            # update, so don't flush a frame for the cleared field
             password_field.value = ""
-            page.update()
             # Call success callback
             try:
                 on_login_success()
@@ -22,14 +22,9 @@ class MainPage:
         self.page = page
         self.blocker = Blocker()
         self.platform_cards = {}
+        # platform -> (is_blocked, has_password) snapshot behind each card
+        self._card_state = {}
         self.content_column = None
-        
-        # Sync with hosts file on init (if admin)
-        if self.blocker.is_admin():
-            try:
-                self.blocker.sync_with_hosts_file()
-            except Exception:
-                pass
 
     def create_page(self) -> ft.Container:
         """Create the main page UI."""
@@ -62,6 +57,7 @@ class MainPage:
                 page=self.page,
             )
             self.platform_cards[platform_key] = card
+            self._card_state[platform_key] = (is_blocked, has_password)
             cards.append(card)
 
         # Platforms section
@@ -286,12 +282,27 @@ class MainPage:
         except Exception as e:
             self._show_error(f"Error: {str(e)}")
 
-    def _update_platform_card(self, platform: str) -> None:
+    def on_show(self) -> None:
+        """Refresh dynamic card state when a cached instance is re-shown.
+
+        Only cards whose block/password state actually changed elsewhere
+        are rebuilt; an unchanged dashboard re-attaches as-is.
+        """
+        for platform in list(self.platform_cards):
+            state = (
+                settings.is_platform_blocked(platform),
+                auth.has_platform_password(platform),
+            )
+            if state != self._card_state.get(platform):
+                self._update_platform_card(platform, update_page=False)
+
+    def _update_platform_card(self, platform: str, update_page: bool = True) -> None:
         """Update platform card to reflect current state."""
         platform_name = lang.translate(platform)
         is_blocked = settings.is_platform_blocked(platform)
         has_password = auth.has_platform_password(platform)
-        
+
+        old_card = self.platform_cards.get(platform)
         new_card = create_platform_card(
             platform=platform,
             platform_name=platform_name,
@@ -300,20 +311,21 @@ class MainPage:
             on_toggle=self._handle_platform_toggle,
             page=self.page,
         )
-        
+
         self.platform_cards[platform] = new_card
-        
-        # Rebuild page
-        if self.content_column:
-            for i, control in enumerate(self.content_column.controls):
+        self._card_state[platform] = (is_blocked, has_password)
+
+        # Swap the card in place
+        if self.content_column and old_card is not None:
+            for control in self.content_column.controls:
                 if isinstance(control, ft.Container) and hasattr(control.content, 'controls'):
-                    for j, sub_control in enumerate(control.content.controls):
-                        if isinstance(sub_control, ft.Card):
-                            old_card = self.platform_cards.get(platform)
-                            if old_card and sub_control == old_card:
-                                control.content.controls[j] = new_card
+                    sub_controls = control.content.controls
+                    for j, sub_control in enumerate(sub_controls):
+                        if sub_control is old_card:
+                            sub_controls[j] = new_card
+                            if update_page:
                                 self.page.update()
-                                return
+                            return
 
     def _show_password_dialog(self, platform: str, on_confirm: Callable[[str], None]) -> None:
         """Show password input dialog."""
@@ -14,6 +14,8 @@ class LanguageManager:
             "bn": self._get_bengali_translations(),
         }
         self.current_language = settings.get_language()
+        # Active table resolved once per language switch, not per lookup
+        self._active_translations = self.translations.get(self.current_language, {})
 
     def _get_english_translations(self) -> Dict[str, str]:
         """Get English translations."""
@@ -245,6 +247,7 @@ class LanguageManager:
         """Set current language."""
         if language in self.translations:
             self.current_language = language
+            self._active_translations = self.translations[language]
             settings.set_language(language)
 
     def translate(self, key: str, **kwargs) -> str:
@@ -258,8 +261,7 @@ class LanguageManager:
         Returns:
             Translated text or key if not found
         """
-        translations = self.translations.get(self.current_language, {})
-        text = translations.get(key, key)
+        text = self._active_translations.get(key, key)
         
         # Format with kwargs if provided
         if kwargs:
@@ -13,6 +13,9 @@ import threading
 # Global tray icon singleton
 _global_tray_icon = None
 _global_tray_thread = None
+# Set by the tray thread when its run loop unwinds, so shutdown can wait
+# for the real exit instead of sleeping a fixed interval
+_global_tray_stopped = threading.Event()
 
 
 class SystemIntegration:
@@ -20,6 +23,7 @@ class SystemIntegration:
 
     def __init__(self):
         self.is_windows = platform.system() == "Windows"
+        self._app_path = None
 
     def check_admin_privileges(self) -> bool:
         """Check if running with administrator privileges."""
@@ -99,11 +103,13 @@ class SystemIntegration:
         return get_or_create_tray_icon(icon_path, show_callback, quit_callback, menu_title)
 
     def get_app_path(self) -> str:
-        """Get the path to the current application executable."""
-        if getattr(sys, 'frozen', False):
-            return sys.executable
-        else:
-            return f'"{sys.executable}" -m src.main'
+        """Get the path to the current application executable (cached)."""
+        if self._app_path is None:
+            if getattr(sys, 'frozen', False):
+                self._app_path = sys.executable
+            else:
+                self._app_path = f'"{sys.executable}" -m src.main'
+        return self._app_path
 
 
 # Global instance
@@ -113,14 +119,17 @@ system_integration = SystemIntegration()
 def stop_tray_icon():
     """Stop and reset the global tray icon. Call this on quit."""
     global _global_tray_icon, _global_tray_thread
-    
+
     if _global_tray_icon is not None:
         try:
             _global_tray_icon.stop()
         except Exception:
             pass
+        # Handshake with the tray thread: returns the moment run() unwinds
+        if _global_tray_thread is not None and _global_tray_thread.is_alive():
+            _global_tray_stopped.wait(timeout=1.0)
         _global_tray_icon = None
-    
+
     _global_tray_thread = None
 
 
@@ -174,7 +183,10 @@ def get_or_create_tray_icon(
                 _global_tray_icon.run()
             except Exception:
                 pass
+            finally:
+                _global_tray_stopped.set()
 
+        _global_tray_stopped.clear()
         _global_tray_thread = threading.Thread(target=run_tray, daemon=True)
         _global_tray_thread.start()
 
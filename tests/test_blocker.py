@@ -98,3 +98,178 @@ class TestBlockerConstants:
         from config.constants import PLATFORM_DOMAINS
         for platform, domains in PLATFORM_DOMAINS.items():
             assert len(domains) > 0, f"{platform} should have domains"
+
+
+class TestBlockCustomDomainsBatch:
+    """Test batched custom-domain blocking against a temporary hosts file."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        import src.core.blocker as blocker_module
+        from src.core.hosts_manager import HostsManager
+        self.blocker_module = blocker_module
+        self.HostsManager = HostsManager
+
+    def _make_blocker(self, tmp_path, monkeypatch):
+        """Build a Blocker on a temp hosts file with settings stubbed out."""
+        manager = self.HostsManager.__new__(self.HostsManager)
+        manager.hosts_path = tmp_path / "hosts"
+        manager.backup_dir = tmp_path / "backups"
+        manager.redirect_ip = "127.0.0.1"
+        manager._last_backup_hash = None
+        manager._is_admin_cached = True
+        manager._marker_present = None
+        manager._flush_dns_cache = lambda: None  # No ipconfig in tests
+        manager.backup_dir.mkdir()
+        manager.hosts_path.write_text("127.0.0.1 localhost\n", encoding="utf-8")
+
+        blocker = self.blocker_module.Blocker.__new__(self.blocker_module.Blocker)
+        blocker.hosts_manager = manager
+
+        recorded = []
+        fake_settings = MagicMock()
+        fake_settings.add_custom_domain.side_effect = recorded.append
+        monkeypatch.setattr(self.blocker_module, "settings", fake_settings)
+        return blocker, manager, recorded
+
+    def test_mixed_batch_blocks_only_valid(self, tmp_path, monkeypatch):
+        """Test a mixed batch blocks valid domains in one write."""
+        blocker, manager, recorded = self._make_blocker(tmp_path, monkeypatch)
+        writes = []
+        real_block = manager.block_domains
+        manager.block_domains = lambda *a, **kw: writes.append(a) or real_block(*a, **kw)
+
+        success, error = blocker.block_custom_domains(
+            ["alpha.com", "not_a_domain", "beta.com"]
+        )
+        assert success is True
+        assert error is None
+        blocked = manager.get_blocked_domains()
+        assert {"alpha.com", "www.alpha.com", "beta.com", "www.beta.com"} <= blocked
+        assert not any("not_a_domain" in d for d in blocked)
+        # Only valid domains recorded, via a single hosts-file write
+        assert recorded == ["alpha.com", "beta.com"]
+        assert len(writes) == 1
+
+    def test_all_invalid_batch_fails(self, tmp_path, monkeypatch):
+        """Test a batch with no valid domains fails without writing."""
+        blocker, manager, recorded = self._make_blocker(tmp_path, monkeypatch)
+        success, error = blocker.block_custom_domains(["not_a_domain", ""])
+        assert success is False
+        assert error == "No valid domains"
+        assert recorded == []
+        assert manager.hosts_path.read_text(encoding="utf-8") == "127.0.0.1 localhost\n"
+
+
+class _StubPage:
+    """Minimal flet page stand-in for queue tests."""
+
+    def __init__(self):
+        self.snack_bar = None
+
+    def update(self):
+        pass
+
+    def run_thread(self, handler):
+        handler()
+
+
+class _StubBlocker:
+    """Records flushed batches; can fail the next write on demand."""
+
+    def __init__(self):
+        self.batches = []
+        self.fail_next = False
+
+    def get_custom_domains(self):
+        return []
+
+    def is_admin(self):
+        return True
+
+    def block_custom_domains(self, domains):
+        if self.fail_next:
+            self.fail_next = False
+            return False, "write failed"
+        self.batches.append(list(domains))
+        return True, None
+
+
+class _StubField:
+    """Stand-in for the domain TextField."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class TestCustomDomainPageQueue:
+    """Test the debounced add queue on the custom domain page."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from src.ui.custom_domain_page import CustomDomainPage
+        self.CustomDomainPage = CustomDomainPage
+
+    def _make_view(self):
+        """Build a page instance with stubbed flet page and blocker."""
+        import threading
+        view = self.CustomDomainPage.__new__(self.CustomDomainPage)
+        view.page = _StubPage()
+        view.blocker = _StubBlocker()
+        view.domain_list_view = None
+        view._empty_tile = None
+        view._pending_adds = []
+        view._flush_timer = None
+        view._pending_lock = threading.Lock()
+        return view
+
+    def test_flush_racing_adds_drops_nothing(self):
+        """Test concurrent adds and flushes lose and duplicate nothing."""
+        import threading
+        import time
+
+        view = self._make_view()
+        domains = [f"race{i}.com" for i in range(40)]
+
+        def add(batch):
+            for domain in batch:
+                view._add_domain(_StubField(domain))
+
+        adders = [
+            threading.Thread(target=add, args=(domains[i::4],)) for i in range(4)
+        ]
+        flusher = threading.Thread(
+            target=lambda: [view._flush_pending_adds() for _ in range(50)]
+        )
+        for t in adders + [flusher]:
+            t.start()
+        for t in adders + [flusher]:
+            t.join()
+
+        # Drain whatever the last debounce timer hasn't flushed yet
+        deadline = time.time() + 2
+        while time.time() < deadline:
+            view._flush_pending_adds()
+            flushed = [d for batch in view.blocker.batches for d in batch]
+            if len(flushed) >= len(domains):
+                break
+            time.sleep(0.05)
+
+        assert sorted(flushed) == sorted(domains)
+
+    def test_failed_flush_requeues_batch(self):
+        """Test a failed write puts the batch back instead of dropping it."""
+        view = self._make_view()
+        view.blocker.fail_next = True
+        with view._pending_lock:
+            view._pending_adds.extend(["keep1.com", "keep2.com"])
+
+        view._flush_pending_adds()
+        assert view._pending_adds == ["keep1.com", "keep2.com"]
+        assert view.blocker.batches == []
+
+        view._flush_pending_adds()
+        assert view.blocker.batches == [["keep1.com", "keep2.com"]]
+        assert view._pending_adds == []
@@ -56,3 +56,88 @@ class TestHostsManagerBackup:
         """Test backup_hosts returns boolean."""
         result = self.hosts_manager.backup_hosts()
         assert isinstance(result, bool)
+
+
+class TestHostsManagerRoundTrip:
+    """Test block/unblock round trips against a temporary hosts file."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from src.core.hosts_manager import HostsManager, MAX_DOMAINS_PER_LINE
+        self.HostsManager = HostsManager
+        self.max_per_line = MAX_DOMAINS_PER_LINE
+
+    def _make_manager(self, tmp_path, content="127.0.0.1 localhost\n"):
+        """Build a manager pointed at a temporary hosts file."""
+        manager = self.HostsManager.__new__(self.HostsManager)
+        manager.hosts_path = tmp_path / "hosts"
+        manager.backup_dir = tmp_path / "backups"
+        manager.redirect_ip = "127.0.0.1"
+        manager._last_backup_hash = None
+        manager._is_admin_cached = True
+        manager._marker_present = None
+        manager._flush_dns_cache = lambda: None  # No ipconfig in tests
+        manager.backup_dir.mkdir()
+        manager.hosts_path.write_text(content, encoding="utf-8")
+        return manager
+
+    def test_block_then_parse_round_trip(self, tmp_path):
+        """Test domains written across packed lines all parse back."""
+        manager = self._make_manager(tmp_path)
+        domains = [f"site{i}.com" for i in range(self.max_per_line + 3)]
+        assert manager.block_domains(domains) is True
+        assert manager.get_blocked_domains() >= set(domains)
+        # More domains than fit one line means at least two entry lines
+        entry_lines = [
+            line for line in manager.read_hosts()
+            if line.startswith("127.0.0.1") and "localhost" not in line
+        ]
+        assert len(entry_lines) >= 2
+
+    def test_unblock_single_token_from_packed_line(self, tmp_path):
+        """Test unblocking one domain keeps the rest of its packed line."""
+        manager = self._make_manager(tmp_path)
+        manager.block_domains(["a.com", "b.com", "c.com"])
+        assert manager.unblock_domains(["b.com"]) is True
+        blocked = manager.get_blocked_domains()
+        assert "b.com" not in blocked
+        assert {"a.com", "c.com"} <= blocked
+
+    def test_force_reblock_does_not_duplicate(self, tmp_path):
+        """Test force re-blocking leaves exactly one entry per domain."""
+        manager = self._make_manager(tmp_path)
+        manager.block_domains(["dup.com"])
+        manager.block_domains(["dup.com"], force=True)
+        content = manager.hosts_path.read_text(encoding="utf-8")
+        assert content.split().count("dup.com") == 1
+
+    def test_append_path_repairs_missing_trailing_newline(self, tmp_path):
+        """Test the marker fast path doesn't glue onto an unterminated line."""
+        manager = self._make_manager(
+            tmp_path,
+            content="127.0.0.1 localhost\n# DeepFocus entries\n127.0.0.1 a.com",
+        )
+        manager._marker_present = True
+        assert manager.block_domains(["b.com"]) is True
+        blocked = manager.get_blocked_domains()
+        assert {"a.com", "b.com"} <= blocked
+        assert "a.com127.0.0.1" not in manager.hosts_path.read_text(encoding="utf-8")
+
+    def test_bad_byte_keeps_other_entries(self, tmp_path):
+        """Test one undecodable token doesn't empty the parsed set."""
+        manager = self._make_manager(tmp_path)
+        manager.hosts_path.write_bytes(
+            b"127.0.0.1 localhost\n127.0.0.1 bad\xff.com good.com\n"
+        )
+        assert "good.com" in manager.get_blocked_domains()
+
+    def test_indented_entry_is_parsed(self, tmp_path):
+        """Test redirect lines with leading whitespace still count."""
+        manager = self._make_manager(
+            tmp_path,
+            content="   127.0.0.1 indented.com\n# 127.0.0.1 commented.com\n",
+        )
+        blocked = manager.get_blocked_domains()
+        assert "indented.com" in blocked
+        assert "commented.com" not in blocked